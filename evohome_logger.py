@@ -1,31 +1,53 @@
 #!/usr/bin/env python3
 import argparse
+import fcntl
+import functools
+import inspect
+import ipaddress
 import json
 import logging
 import logging.handlers
+import math
 import os
+import signal
 import socket
 import sys
+import threading
 import time
-from datetime import datetime, timezone
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, NamedTuple, Optional, Tuple
 from urllib.parse import urlparse
 
-from evohomeclient import EvohomeClient  # v1
 try:
-    from evohomeclient2 import EvohomeClient as EvohomeClientV2  # type: ignore
-except Exception:  # noqa: BLE001
-    EvohomeClientV2 = None
-from influxdb_client import InfluxDBClient, Point
-from influxdb_client.client.write_api import SYNCHRONOUS
-import requests
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# evohomeclient/influxdb_client/requests are imported where used so --help and
+# configuration errors don't pay for loading them.
+if TYPE_CHECKING:
+    from evohomeclient import EvohomeClient
+    from influxdb_client import InfluxDBClient
+    from influxdb_client.client.write_api import WriteOptions
 
 DATA_DIR = Path(os.environ.get("DATA_DIR", "/data"))
 IP_CACHE_FILE = DATA_DIR / "influx_ip_cache.json"
-OFFLINE_BUFFER_FILE = DATA_DIR / "offline_buffer.json"
+IP_CACHE_LOCK_FILE = DATA_DIR / "influx_ip_cache.lock"
+OFFLINE_BUFFER_FILE = DATA_DIR / "offline_buffer.lp"  # append-only line protocol, one record per line
+LEGACY_OFFLINE_BUFFER_FILE = DATA_DIR / "offline_buffer.json"  # pre-.lp format, drained on next success
 TOKEN_CACHE_FILE = DATA_DIR / "evohome_token.json"
 DEFAULT_TIMEOUT_MS = int(os.environ.get("HTTP_TIMEOUT_MS", "10000"))
+MAX_OFFLINE_RECORDS = max(1, int(os.environ.get("MAX_OFFLINE_RECORDS", "50000")))  # 0 would silently keep everything
+WRITE_BATCH_SIZE = 5_000  # points per InfluxDB write request
+DEFAULT_DAEMON_INTERVAL = 60  # seconds between cycles for --daemon without --interval
+DNS_CACHE_TTL = int(os.environ.get("DNS_CACHE_TTL", "300"))
+DNS_PROBE_TIMEOUT = 1.0  # seconds; TCP connect that validates an expired cached IP when DNS fails
+# ATOMIC_WRITES=0 writes caches in place without fsync/rename (for tmpfs or other scratch DATA_DIRs).
+ATOMIC_WRITES = os.environ.get("ATOMIC_WRITES", "1").lower() not in {"0", "false", "no", "off"}
+DEBUG = False  # set by setup_logger; guards debug-only work on hot paths
 
 
 def parse_args() -> argparse.Namespace:
@@ -35,10 +57,27 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Run connectivity checks only (Evohome login + InfluxDB health), no writes",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help=f"Keep running and collect every --interval seconds (default {DEFAULT_DAEMON_INTERVAL})",
+    )
+    parser.add_argument(
+        "--interval",
+        type=int,
+        metavar="SECONDS",
+        help="Keep running and collect every SECONDS, reusing the Evohome and InfluxDB clients",
+    )
+    args = parser.parse_args()
+    if args.interval is not None and args.interval <= 0:
+        parser.error("--interval must be a positive number of seconds")
+    if args.daemon and args.interval is None:
+        args.interval = DEFAULT_DAEMON_INTERVAL
+    return args
 
 
 def setup_logger() -> logging.Logger:
+    global DEBUG
     logger = logging.getLogger("evohome_logger")
     if logger.handlers:
         return logger
@@ -48,14 +87,27 @@ def setup_logger() -> logging.Logger:
         level_name = "DEBUG"
     level = getattr(logging, (level_name or "INFO").upper(), logging.INFO)
     logger.setLevel(level)
+    DEBUG = logger.isEnabledFor(logging.DEBUG)
     handlers: List[logging.Handler] = []
 
+    # USE_SYSLOG: "auto" (default) probes /dev/log, "0"/"false" skips syslog, "1"/"true" uses it without probing
+    # (still falling back to stdout only if the socket cannot be connected).
+    use_syslog = os.environ.get("USE_SYSLOG", "auto").lower()
     syslog_path = Path("/dev/log")
-    if syslog_path.exists():
+    if use_syslog not in {"0", "false", "no", "off"} and (
+        use_syslog in {"1", "true", "yes", "on"} or syslog_path.exists()
+    ):
         try:
-            handlers.append(logging.handlers.SysLogHandler(address=str(syslog_path)))
+            syslog_handler = logging.handlers.SysLogHandler(address=str(syslog_path))
         except OSError:
-            pass
+            syslog_handler = None
+        # Python 3.11+ defers a failed unix-socket connect to the first emit; detect it here.
+        if syslog_handler is not None and syslog_handler.socket.fileno() == -1:
+            syslog_handler.close()
+            syslog_handler = None
+        if syslog_handler is not None:
+            syslog_handler.setLevel(max(level, logging.INFO))  # keep DEBUG output out of syslog
+            handlers.append(syslog_handler)
 
     handlers.append(logging.StreamHandler(sys.stdout))
     formatter = logging.Formatter(
@@ -70,12 +122,65 @@ def setup_logger() -> logging.Logger:
     return logger
 
 
+def install_fast_json() -> None:
+    """Route plain json.loads calls (requests' Response.json(), influxdb_client) through orjson.
+
+    orjson reads integers wider than 64 bits as floats; neither API returns such values.
+    """
+    if orjson is None or getattr(json.loads, "_orjson_wrapper", False):
+        return
+    stdlib_loads = json.loads
+
+    def fast_loads(s, *args, **kwargs):
+        if args or kwargs:  # object_hook, parse_float, ... need the stdlib decoder
+            return stdlib_loads(s, *args, **kwargs)
+        try:
+            return orjson.loads(s)
+        except (orjson.JSONDecodeError, TypeError):
+            return stdlib_loads(s)  # NaN/Infinity, odd input types: keep stdlib behaviour and errors
+
+    fast_loads._orjson_wrapper = True  # type: ignore[attr-defined]
+    json.loads = fast_loads
+
+
 def atomic_write_json(path: Path, payload: Dict) -> None:
+    atomic_write_bytes(path, orjson.dumps(payload) if orjson else json.dumps(payload).encode("utf-8"))
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if not ATOMIC_WRITES:
+        path.write_bytes(data)
+        return
     tmp_path = path.with_suffix(path.suffix + ".tmp")
-    with tmp_path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle)
-    tmp_path.replace(path)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:  # os.write may write less than asked (e.g. on a nearly full disk)
+                view = view[os.write(fd, view):]
+            os.fsync(fd)  # make the cache durable before the rename publishes it
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)  # don't leave a partial file taking up space
+        raise
+    fsync_dir(path.parent)
+
+
+def fsync_dir(path: Path) -> None:
+    """Persist a rename/create in ``path`` (best effort; not every filesystem supports it)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 def try_write_json(path: Path, payload: Dict, logger: logging.Logger) -> bool:
@@ -92,7 +197,7 @@ def load_token_cache(logger: logging.Logger) -> Optional[Dict]:
     if not data:
         return None
     expires_at = data.get("expires_at")
-    if expires_at:
+    if expires_at is not None:
         try:
             if time.time() > float(expires_at) - 60:  # refresh 1 minute early
                 logger.info("Cached Evohome token expired or near expiry; ignoring cached token")
@@ -132,42 +237,50 @@ def json_safe(value):
     return str(value)
 
 
+TOKEN_ATTRS = (
+    "access_token",
+    "refresh_token",
+    "access_token_expires",
+    "token_expires",
+    "token_expiration",
+    "session_id",
+    "tokens",
+)
+
+
 def persist_token_cache(client: "EvohomeClient", logger: logging.Logger) -> None:
-    token_payload: Dict = {}
-    candidates = [
-        "access_token",
-        "refresh_token",
-        "access_token_expires",
-        "token_expires",
-        "token_expiration",
-        "session_id",
-        "tokens",
-    ]
-    for key in candidates:
-        if hasattr(client, key):
-            token_payload[key] = getattr(client, key)
-
-    if hasattr(client, "tokens") and isinstance(getattr(client, "tokens"), dict):
-        token_payload.update(getattr(client, "tokens"))
-
-    expires_source = (
-        token_payload.get("access_token_expires")
-        or token_payload.get("token_expires")
-        or token_payload.get("token_expiration")
-        or token_payload.get("expires_at")
-    )
+    state = getattr(client, "__dict__", None)
+    if state:
+        token_payload: Dict = {key: state[key] for key in TOKEN_ATTRS if key in state}
+    else:  # clients using __slots__ or computed attributes
+        token_payload = {key: getattr(client, key) for key in TOKEN_ATTRS if hasattr(client, key)}
+
+    tokens = token_payload.get("tokens")
+    if isinstance(tokens, dict):
+        token_payload.update(tokens)
+
+    expires_source = None
+    for key in ("access_token_expires", "token_expires", "token_expiration", "expires_at"):
+        value = token_payload.get(key)
+        if value is not None:  # 0 / "" are real values, not "missing"
+            expires_source = value
+            break
     expires_at = normalize_expiry(expires_source)
-    if expires_at:
+    if expires_at is not None:
         token_payload["expires_at"] = expires_at
 
     if not token_payload:
         return
 
     token_payload = json_safe(token_payload)
+    if token_payload == load_json(TOKEN_CACHE_FILE):
+        return  # unchanged; skip the rewrite + fsync
     try_write_json(TOKEN_CACHE_FILE, token_payload, logger)
 
 
 def is_rate_limit_error(exc: Exception) -> bool:
+    import requests
+
     if isinstance(exc, requests.HTTPError):
         try:
             if getattr(exc.response, "status_code", None) == 429:
@@ -180,43 +293,144 @@ def is_rate_limit_error(exc: Exception) -> bool:
 
 def load_json(path: Path) -> Optional[Dict]:
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        data = path.read_bytes()
+        return orjson.loads(data) if orjson else json.loads(data)
     except FileNotFoundError:
         return None
-    except json.JSONDecodeError:
+    except ValueError:  # json/orjson JSONDecodeError, bad UTF-8
         return None
 
 
-def resolve_influx_ip(hostname: str, logger: logging.Logger) -> Tuple[Optional[str], bool]:
-    """Return (ip, from_cache)."""
-    cached = load_json(IP_CACHE_FILE) or {}
+@functools.lru_cache(maxsize=4)
+def parse_url(url: str):
+    """urlparse() memoized; the InfluxDB URL is parsed on every client lookup/cycle."""
+    return urlparse(url)  # ParseResult is an immutable namedtuple, safe to share
+
+
+def probe_tcp(ip: str, port: int) -> bool:
+    try:
+        with socket.create_connection((ip, port), timeout=DNS_PROBE_TIMEOUT):
+            return True
+    except OSError:
+        return False
+
+
+def influx_port(parsed) -> int:
+    return parsed.port or (443 if parsed.scheme == "https" else 80)
+
+
+_IP_CACHE: Dict = {}  # in-process copy of IP_CACHE_FILE so --interval cycles skip the file read
+
+
+def load_ip_cache() -> Dict:
+    if not _IP_CACHE:
+        data = load_json(IP_CACHE_FILE)
+        if isinstance(data, dict):
+            _IP_CACHE.update(data)
+    return _IP_CACHE
+
+
+def is_ip_literal(hostname: Optional[str]) -> bool:
+    if not hostname:
+        return False
+    try:
+        ipaddress.ip_address(hostname)
+        return True
+    except ValueError:
+        return False
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on path; degrades to no locking if that isn't possible."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle = path.open("a")
+    except OSError:
+        yield
+        return
+    with handle:
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        except OSError:
+            pass
+        yield  # closing the handle releases the lock
+
+
+def resolve_influx_ip(hostname: str, logger: logging.Logger, port: Optional[int] = None) -> Tuple[Optional[str], bool]:
+    """Return (ip, from_cache).
+
+    A cached IP younger than DNS_CACHE_TTL is reused without a DNS lookup. When DNS
+    fails, an expired cached IP is used as a fallback; if ``port`` is given it must
+    also accept a TCP connection.
+    """
+    if is_ip_literal(hostname):
+        return hostname, False  # nothing to resolve or cache
+
+    cached = load_ip_cache()
     cached_ip = cached.get("ip") if cached.get("host") == hostname else None
 
     if not hostname:
         return cached_ip, True if cached_ip else False
 
-    try:
-        ip = socket.getaddrinfo(hostname, None)[0][4][0]
-        if ip != cached_ip:
-            try_write_json(IP_CACHE_FILE, {"host": hostname, "ip": ip}, logger)
-        return ip, False
-    except socket.gaierror as exc:
-        logger.error("DNS lookup failed for %s: %s", hostname, exc)
-        if cached_ip:
-            logger.warning("Using cached InfluxDB IP %s", cached_ip)
+    if cached_ip:
+        age = time.time() - (safe_float(cached.get("resolved_at")) or 0.0)
+        if 0 <= age < DNS_CACHE_TTL:
+            logger.debug("Reusing cached IP %s for %s (age %.0fs)", cached_ip, hostname, age)
             return cached_ip, True
+
+    # Serialize re-resolution across processes sharing DATA_DIR: whoever holds the lock
+    # does the lookup, the others pick up its fresh cache entry instead of querying DNS.
+    seen_at = cached.get("resolved_at") if cached_ip else None
+    with file_lock(IP_CACHE_LOCK_FILE):
+        latest = load_json(IP_CACHE_FILE)
+        if (
+            isinstance(latest, dict)
+            and latest.get("host") == hostname
+            and latest.get("ip")
+            and latest.get("resolved_at") != seen_at
+            and 0 <= time.time() - (safe_float(latest.get("resolved_at")) or 0.0) < DNS_CACHE_TTL
+        ):
+            _IP_CACHE.clear()
+            _IP_CACHE.update(latest)
+            logger.debug("Using IP %s for %s refreshed by another process", latest["ip"], hostname)
+            return latest["ip"], True
+
+        try:
+            ip = socket.getaddrinfo(
+                hostname,
+                port or 0,
+                socket.AF_UNSPEC,
+                socket.SOCK_STREAM,
+                0,
+                socket.AI_ADDRCONFIG | socket.AI_NUMERICSERV,
+            )[0][4][0]
+            # Reached only with a missing, expired or other-host entry, so always refresh it.
+            record = {"host": hostname, "ip": ip, "resolved_at": time.time()}
+            _IP_CACHE.clear()
+            _IP_CACHE.update(record)
+            try_write_json(IP_CACHE_FILE, record, logger)
+            return ip, False
+        except socket.gaierror as exc:
+            logger.error("DNS lookup failed for %s: %s", hostname, exc)
+            if cached_ip:
+                if port is None or probe_tcp(cached_ip, port):
+                    logger.warning("Using cached InfluxDB IP %s", cached_ip)
+                    return cached_ip, True
+                logger.warning("Cached InfluxDB IP %s is not accepting connections", cached_ip)
     return None, False
 
 
 def build_influx_endpoint(base_url: str, resolved_ip: Optional[str]) -> Tuple[str, Optional[str], Optional[str]]:
     """Return (url, host_header, hostname)."""
-    parsed = urlparse(base_url)
+    parsed = parse_url(base_url)
     hostname = parsed.hostname
+    if is_ip_literal(hostname):
+        return base_url, None, hostname
     if resolved_ip and hostname and resolved_ip != hostname:
-        netloc = resolved_ip
+        netloc = f"[{resolved_ip}]" if ":" in resolved_ip else resolved_ip  # bracket IPv6 literals
         if parsed.port:
-            netloc = f"{resolved_ip}:{parsed.port}"
+            netloc = f"{netloc}:{parsed.port}"
         rebuilt = parsed._replace(netloc=netloc)
         return rebuilt.geturl(), hostname, hostname
     return base_url, None, hostname
@@ -248,7 +462,19 @@ def get_config(logger: logging.Logger) -> Dict:
     }
 
 
+@functools.lru_cache(maxsize=None)
+def client_params(cls) -> frozenset:
+    """Return the constructor parameter names of an Evohome client class (cached per class)."""
+    return frozenset(inspect.signature(cls).parameters)
+
+
 def build_evo_client(config: Dict, logger: logging.Logger):
+    from evohomeclient import EvohomeClient  # v1
+    try:
+        from evohomeclient2 import EvohomeClient as EvohomeClientV2  # type: ignore
+    except Exception:  # noqa: BLE001
+        EvohomeClientV2 = None
+
     tokens = load_token_cache(logger)
     client = None
     preferred_classes = []
@@ -289,9 +515,7 @@ def build_evo_client(config: Dict, logger: logging.Logger):
     for label, cls in preferred_classes:
         base_kwargs: Dict = {}
         try:
-            import inspect
-
-            params = inspect.signature(cls).parameters
+            params = client_params(cls)
             if "debug" in params:
                 base_kwargs["debug"] = False
             token_kwargs = prepare_token_kwargs(params, tokens, label)
@@ -313,7 +537,9 @@ def build_evo_client(config: Dict, logger: logging.Logger):
     raise RuntimeError("Evohome client creation failed")
 
 
-def create_influx_client(url: str, token: str, org: str, verify_tls: bool, host_header: Optional[str]) -> InfluxDBClient:
+def create_influx_client(url: str, token: str, org: str, verify_tls: bool, host_header: Optional[str]) -> "InfluxDBClient":
+    from influxdb_client import InfluxDBClient
+
     headers = {"User-Agent": "evohome-logger/1.0"}
     if host_header:
         headers["Host"] = host_header
@@ -322,55 +548,75 @@ def create_influx_client(url: str, token: str, org: str, verify_tls: bool, host_
         token=token,
         org=org,
         timeout=DEFAULT_TIMEOUT_MS,
+        enable_gzip=True,
         verify_ssl=verify_tls,
         default_headers=headers,
+        connection_pool_maxsize=1,  # one writer thread; keep a single keep-alive connection warm
     )
 
 
 def safe_float(value) -> Optional[float]:
+    # Evohome values are almost always float/int/None; only other types take the try/except path.
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if value is None:
+        return None
     try:
-        if value is None:
-            return None
         return float(value)
     except (TypeError, ValueError):
         return None
 
 
-def extract_zone_meta(installation: Dict) -> Dict[str, Dict]:
-    meta: Dict[str, Dict] = {}
-    gateways = installation.get("gateways") or []
-    for gateway in gateways:
-        systems = gateway.get("temperatureControlSystems") or []
-        for system in systems:
-            system_id = system.get("systemId") or system.get("systemID")
-            zones = system.get("zones") or []
-            for zone in zones:
-                zone_id = str(zone.get("zoneId") or zone.get("zoneID") or zone.get("id") or "")
-                if not zone_id:
-                    continue
-                meta[zone_id] = {
-                    "system_id": system_id,
-                    "heat_demand": zone.get("heatDemand"),
-                    "setpoint_status": zone.get("setpointStatus") or {},
-                    "temperature_status": zone.get("temperatureStatus") or {},
-                    "active_faults": zone.get("activeFaults") or [],
-                    "zone_type": zone.get("zoneType"),
-                }
-    return meta
+_EMPTY: Dict = {}  # shared read-only default for missing sub-dicts; never mutate
+
+
+class ZoneMeta(NamedTuple):
+    """Per-zone values from the installation payload, already converted for build_points."""
+
+    system_id: Optional[str] = None
+    zone_type: Optional[str] = None
+    temperature: Optional[float] = None
+    target: Optional[float] = None
+    heat_demand: Optional[float] = None
+    status: Optional[str] = None
+    fault_count: Optional[int] = 0
+
+
+_NO_META = ZoneMeta()  # zones missing from the installation payload
 
 
-def extract_dhw(installation: Dict) -> List[Dict]:
+def extract_installation(installation: Dict) -> Tuple[Dict[str, ZoneMeta], List[Dict]]:
+    """Return (zone_meta, dhw_points) from a single walk of the installation tree."""
+    meta: Dict[str, ZoneMeta] = {}
     dhw_points: List[Dict] = []
-    gateways = installation.get("gateways") or []
-    for gateway in gateways:
-        systems = gateway.get("temperatureControlSystems") or []
-        for system in systems:
+    for gateway in installation.get("gateways") or []:
+        for system in gateway.get("temperatureControlSystems") or []:
             system_id = system.get("systemId") or system.get("systemID")
-            dhw = system.get("dhw") or {}
+            for zone in system.get("zones") or []:
+                zone_get = zone.get
+                zone_id = str(zone_get("zoneId") or zone_get("zoneID") or zone_get("id") or "")
+                if not zone_id:
+                    continue
+                setpoint_status = zone_get("setpointStatus") or _EMPTY
+                faults = zone_get("activeFaults") or []
+                meta[zone_id] = ZoneMeta(
+                    system_id=system_id,
+                    zone_type=zone_get("zoneType"),
+                    temperature=safe_float((zone_get("temperatureStatus") or _EMPTY).get("temperature")),
+                    target=safe_float(setpoint_status.get("targetHeatTemperature")),
+                    heat_demand=safe_float(zone_get("heatDemand")),
+                    status=setpoint_status.get("status"),
+                    fault_count=len(faults) if isinstance(faults, list) else None,
+                )
+
+            dhw = system.get("dhw") or _EMPTY
             if not dhw:
                 continue
-            dhw_state = dhw.get("stateStatus") or dhw.get("state") or {}
-            temp_status = dhw.get("temperatureStatus") or {}
+            dhw_state = dhw.get("stateStatus") or dhw.get("state") or _EMPTY
+            temp_status = dhw.get("temperatureStatus") or _EMPTY
             zone_id = dhw.get("dhwId") or dhw.get("id") or dhw.get("zoneId") or dhw.get("zoneID")
             dhw_points.append(
                 {
@@ -382,145 +628,258 @@ def extract_dhw(installation: Dict) -> List[Dict]:
                     "mode": dhw_state.get("mode"),
                 }
             )
-    return dhw_points
+    return meta, dhw_points
+
 
+_ESCAPE_TAG = str.maketrans({",": r"\,", "=": r"\=", " ": r"\ ", "\n": r"\n", "\t": r"\t", "\r": r"\r"})
+_ESCAPE_STRING = str.maketrans({'"': r'\"', "\\": r"\\"})
+
+
+def format_field_value(value) -> Optional[str]:
+    """Format a field value as line protocol (same rules as influxdb_client.Point)."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return f"{value}i"
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return None
+        text = str(value)
+        return text[:-2] if text.endswith(".0") else text
+    return '"' + str(value).translate(_ESCAPE_STRING) + '"'
 
-def build_points(temperatures: List[Dict], installation: Dict, logger: logging.Logger) -> List[Point]:
-    timestamp = datetime.now(timezone.utc)
-    zone_meta = extract_zone_meta(installation)
-    points: List[Point] = []
-    dhw_points: List[Dict] = extract_dhw(installation)
+
+def append_line(buf: List[str], measurement: str, tags: Dict[str, object], fields: Dict[str, object], ts_ns: int) -> None:
+    """Append one line-protocol record to buf; records without fields are dropped."""
+    field_parts = []
+    for key, value in sorted(fields.items()):
+        if value is None:
+            continue
+        text = format_field_value(value)
+        if text is not None:
+            field_parts.append(f"{key}={text}")
+    if not field_parts:
+        return
+    tag_parts = []
+    for key, value in sorted(tags.items()):
+        if not value:
+            continue
+        escaped = str(value).translate(_ESCAPE_TAG)
+        if escaped.endswith("\\"):
+            escaped += " "
+        tag_parts.append(f",{key}={escaped}")
+    buf.append(f"{measurement}{''.join(tag_parts)} {','.join(field_parts)} {ts_ns}")
+
+
+def build_points(temperatures: List[Dict], installation: Dict, logger: logging.Logger) -> List[str]:
+    """Return line-protocol records for all zones and DHW."""
+    ts_ns = time.time_ns()
+    zone_meta, dhw_points = extract_installation(installation)
+    lines: List[str] = []
     dhw_zone_ids = {d.get("zone_id") for d in dhw_points if d.get("zone_id")}
+    meta_get = zone_meta.get
+    to_float = safe_float  # local binding for the per-zone loop
 
     for zone in temperatures or []:
-        thermostat_type = str(zone.get("thermostat") or zone.get("thermostatModelType") or "").upper()
-        zone_id = str(zone.get("id") or zone.get("zoneId") or zone.get("zoneID") or zone.get("name") or "unknown")
+        zone_get = zone.get
+        thermostat_type = str(zone_get("thermostat") or zone_get("thermostatModelType") or "").upper()
+        zone_id = str(zone_get("id") or zone_get("zoneId") or zone_get("zoneID") or zone_get("name") or "unknown")
 
         if thermostat_type == "DOMESTIC_HOT_WATER" or zone_id in dhw_zone_ids:
             dhw_points.append(
                 {
                     "system_id": None,
                     "zone_id": zone_id,
-                    "status": zone.get("status") or zone.get("mode"),
-                    "temperature": safe_float(zone.get("temp")),
+                    "status": zone_get("status") or zone_get("mode"),
+                    "temperature": to_float(zone_get("temp")),
                     "is_available": True,
-                    "mode": zone.get("mode"),
+                    "mode": zone_get("mode"),
                 }
             )
             continue
 
-        meta = zone_meta.get(zone_id, {})
-        point = Point("evohome_zone").tag("zone_id", zone_id)
-
-        if zone.get("name"):
-            point = point.tag("zone", str(zone.get("name")))
-        if meta.get("system_id"):
-            point = point.tag("system_id", str(meta.get("system_id")))
-        if meta.get("zone_type"):
-            point = point.tag("zone_type", str(meta.get("zone_type")))
+        meta = meta_get(zone_id) or _NO_META
+        tags = {
+            "zone_id": zone_id,
+            "zone": zone_get("name"),
+            "system_id": meta.system_id,
+            "zone_type": meta.zone_type,
+        }
 
-        temp_value = safe_float(zone.get("temp"))
+        temp_value = to_float(zone_get("temp"))
         if temp_value is None:
-            temp_value = safe_float((meta.get("temperature_status") or {}).get("temperature"))
-        if temp_value is not None:
-            point = point.field("temperature", temp_value)
+            temp_value = meta.temperature
 
-        setpoint = safe_float(zone.get("setpoint"))
+        setpoint = to_float(zone_get("setpoint"))
         if setpoint is None:
-            setpoint = safe_float((meta.get("setpoint_status") or {}).get("targetHeatTemperature"))
-        if setpoint is not None:
-            point = point.field("setpoint", setpoint)
+            setpoint = meta.target
 
-        heat_demand = safe_float(zone.get("heat_demand"))
+        heat_demand = to_float(zone_get("heat_demand"))
         if heat_demand is None:
-            heat_demand = safe_float(meta.get("heat_demand"))
-        if heat_demand is not None:
-            point = point.field("heat_demand", heat_demand)
+            heat_demand = meta.heat_demand
+
+        status = zone_get("status") or zone_get("mode") or meta.status
+        fields = {
+            "temperature": temp_value,
+            "setpoint": setpoint,
+            "heat_demand": heat_demand,
+            "status": str(status) if status else None,
+            "fault_count": meta.fault_count,
+        }
+        append_line(lines, "evohome_zone", tags, fields, ts_ns)
+
+    for dhw in dhw_points:
+        availability = dhw.get("is_available")
+        tags = {"system_id": dhw.get("system_id"), "zone_id": dhw.get("zone_id")}
+        fields = {
+            "mode": str(dhw.get("mode")) if dhw.get("mode") else None,
+            "status": str(dhw.get("status")) if dhw.get("status") else None,
+            "temperature": safe_float(dhw.get("temperature")),
+            "is_available": bool(availability) if availability is not None else None,
+        }
+        append_line(lines, "evohome_dhw", tags, fields, ts_ns)
+
+    logger.info("Prepared %d points", len(lines))
+    return lines
 
-        status = zone.get("status") or zone.get("mode") or (meta.get("setpoint_status") or {}).get("status")
-        if status:
-            point = point.field("status", str(status))
 
-        faults = meta.get("active_faults") or []
-        if isinstance(faults, list):
-            point = point.field("fault_count", len(faults))
+def load_offline_records(logger: logging.Logger) -> List[str]:
+    records: List[str] = []
+    legacy = load_json(LEGACY_OFFLINE_BUFFER_FILE)
+    if isinstance(legacy, dict):
+        records.extend(legacy.get("records", []))
+    try:
+        data = OFFLINE_BUFFER_FILE.read_bytes()
+    except FileNotFoundError:
+        return records
+    end = data.rfind(b"\n") + 1
+    if end < len(data):
+        # Trim at the byte level: an interrupted append may have split a multibyte character.
+        logger.warning("Dropping truncated last record from offline buffer")
+    # Split on "\n" only: str.splitlines() would also break records at \x1c-\x1e, \x85 or \u2028.
+    text = data[:end].decode("utf-8", errors="replace")
+    records.extend(line for line in text.split("\n") if line)
+    return records
+
+
+def persist_offline_records(records: List[str], logger: logging.Logger, replace: bool = False) -> None:
+    """Append records to the offline buffer, or rewrite it with exactly these records if replace."""
+    if not records:
+        return
+    if replace:
+        try:
+            atomic_write_bytes(OFFLINE_BUFFER_FILE, ("\n".join(records) + "\n").encode("utf-8"))
+            LEGACY_OFFLINE_BUFFER_FILE.unlink(missing_ok=True)
+        except OSError as exc:  # noqa: BLE001
+            logger.warning("Failed to persist %s: %s", OFFLINE_BUFFER_FILE, exc)
+            return
+        logger.warning("Cached %d records locally (offline buffer rewritten)", len(records))
+        return
+    try:
+        OFFLINE_BUFFER_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with OFFLINE_BUFFER_FILE.open("a+b", buffering=1 << 16) as handle:
+            size = handle.seek(0, os.SEEK_END)
+            if size:
+                # Drop a record torn by an interrupted append so new lines don't join it.
+                handle.seek(max(0, size - 4096))
+                tail = handle.read()
+                if not tail.endswith(b"\n"):
+                    handle.truncate(size - len(tail) + tail.rfind(b"\n") + 1)
+            handle.write(("\n".join(records) + "\n").encode("utf-8"))
+            if ATOMIC_WRITES:
+                handle.flush()
+                os.fsync(handle.fileno())  # buffered data must survive a power cut, like atomic_write_bytes
+    except OSError as exc:  # noqa: BLE001
+        logger.warning("Failed to persist %s: %s", OFFLINE_BUFFER_FILE, exc)
+        return
+    logger.warning("Cached %d records locally (offline buffer)", len(records))
 
-        point = point.time(timestamp)
-        if point.to_line_protocol():
-            points.append(point)
 
-    for dhw in dhw_points:
-        point = Point("evohome_dhw")
-        if dhw.get("system_id"):
-            point = point.tag("system_id", str(dhw.get("system_id")))
-        if dhw.get("zone_id"):
-            point = point.tag("zone_id", str(dhw.get("zone_id")))
-        if dhw.get("mode"):
-            point = point.field("mode", str(dhw.get("mode")))
-        if dhw.get("status"):
-            point = point.field("status", str(dhw.get("status")))
-        temp_value = safe_float(dhw.get("temperature"))
-        if temp_value is not None:
-            point = point.field("temperature", temp_value)
-        availability = dhw.get("is_available")
-        if availability is not None:
-            point = point.field("is_available", bool(availability))
-        point = point.time(timestamp)
-        if point.to_line_protocol():
-            points.append(point)
+def buffer_records(records: List[str], logger: logging.Logger, previous: Optional[List[str]] = None) -> None:
+    """Add records to the offline buffer, enforcing MAX_OFFLINE_RECORDS."""
+    if previous is None:
+        previous = load_offline_records(logger)
+    overflow = len(previous) + len(records) - MAX_OFFLINE_RECORDS
+    if overflow <= 0:
+        persist_offline_records(records, logger)
+        return
+    logger.warning("Offline buffer exceeds %d records; dropping %d oldest", MAX_OFFLINE_RECORDS, overflow)
+    persist_offline_records(list(islice(chain(previous, records), overflow, None)), logger, replace=True)
 
-    logger.info("Prepared %d points", len(points))
-    return points
 
+def clear_offline_records(logger: logging.Logger) -> None:
+    for path in (OFFLINE_BUFFER_FILE, LEGACY_OFFLINE_BUFFER_FILE):
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as exc:  # noqa: BLE001
+            logger.warning("Failed to clear offline buffer %s: %s", path, exc)
 
-def points_to_lines(records: List[Point]) -> List[str]:
-    lines: List[str] = []
-    for rec in records:
-        if not rec:
-            continue
-        line = rec.to_line_protocol()
-        if line:
-            lines.append(line)
-    return lines
 
+def has_offline_records() -> bool:
+    return OFFLINE_BUFFER_FILE.exists() or LEGACY_OFFLINE_BUFFER_FILE.exists()
 
-def load_offline_records() -> List[str]:
-    data = load_json(OFFLINE_BUFFER_FILE) or {}
-    return data.get("records", []) if isinstance(data, dict) else []
 
+def build_write_options() -> "WriteOptions":
+    """Batching options for the Influx WriteApi: ~5k points per gzip'd request, no retries.
 
-def persist_offline_records(records: List[str], logger: logging.Logger) -> None:
-    if not records:
-        return
-    if try_write_json(OFFLINE_BUFFER_FILE, {"records": records}, logger):
-        logger.warning("Cached %d records locally (offline buffer)", len(records))
+    A failed batch goes to the offline buffer and is retried on the next run, so
+    in-client retries would only delay that fallback (and shutdown) by minutes.
+    """
+    from influxdb_client.client.write_api import WriteOptions
 
+    return WriteOptions(
+        batch_size=WRITE_BATCH_SIZE,
+        flush_interval=10_000,
+        jitter_interval=0,
+        max_retries=0,
+    )
 
-def write_points(records: List[Point], influx: InfluxDBClient, bucket: str, org: str, logger: logging.Logger) -> bool:
-    previous = load_offline_records()
-    payload = previous + points_to_lines(records)
 
-    if not payload:
+def write_points(records: List[str], influx: "InfluxDBClient", bucket: str, org: str, logger: logging.Logger) -> bool:
+    previous = load_offline_records(logger)
+    total = len(previous) + len(records)
+    if not total:
         logger.info("No records to write")
         return True
 
+    # Stream backlog + new records without building a combined list; the oldest
+    # records beyond MAX_OFFLINE_RECORDS are skipped.
+    dropped = max(0, total - MAX_OFFLINE_RECORDS)
+    payload = islice(chain(previous, records), dropped, None)
+
+    from influxdb_client import WritePrecision
+
+    failures: List[Exception] = []
+
+    def on_error(_conf, _data, exc: Exception) -> None:
+        failures.append(exc)
+
     try:
-        write_api = influx.write_api(write_options=SYNCHRONOUS)
-        write_api.write(bucket=bucket, org=org, record=payload)
-        if OFFLINE_BUFFER_FILE.exists():
-            try:
-                OFFLINE_BUFFER_FILE.unlink()
-            except OSError as exc:  # noqa: BLE001
-                logger.warning("Failed to clear offline buffer: %s", exc)
-        logger.info("Successfully wrote %d records (including %d from offline cache)", len(payload), len(previous))
+        write_api = influx.write_api(write_options=build_write_options(), error_callback=on_error)
+        try:
+            # The batching WriteApi consumes the iterable and sends WRITE_BATCH_SIZE points per request.
+            # Records (new and buffered) carry time.time_ns() timestamps.
+            write_api.write(bucket=bucket, org=org, record=payload, write_precision=WritePrecision.NS)
+        finally:
+            write_api.close()  # flushes pending batches; errors arrive via on_error
+        if failures:
+            raise failures[-1]
+        clear_offline_records(logger)
+        if dropped:
+            logger.warning("Offline buffer exceeded %d records; dropped %d oldest", MAX_OFFLINE_RECORDS, dropped)
+        logger.info(
+            "Successfully wrote %d records (including %d from offline cache)",
+            total - dropped,
+            max(0, len(previous) - dropped),
+        )
         return True
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to write to InfluxDB: %s", exc)
-        persist_offline_records(payload, logger)
+        buffer_records(records, logger, previous)
         return False
 
 
-def fetch_evohome_data(client: EvohomeClient, location_idx: int, logger: logging.Logger) -> Tuple[List[Dict], Dict, bool, bool]:
+def fetch_evohome_data(client: "EvohomeClient", location_idx: int, logger: logging.Logger) -> Tuple[List[Dict], Dict, bool, bool]:
     def fetch_temperatures():
         try:
             return client.temperatures(force_refresh=True)  # type: ignore[arg-type]
@@ -539,7 +898,7 @@ def fetch_evohome_data(client: EvohomeClient, location_idx: int, logger: logging
         temperatures = []
 
     def log_installation_debug(payload) -> None:
-        if not logger.isEnabledFor(logging.DEBUG):
+        if not DEBUG:
             return
         try:
             if isinstance(payload, list):
@@ -607,6 +966,52 @@ def fetch_evohome_data(client: EvohomeClient, location_idx: int, logger: logging
     return temperatures, installation if installation else {}, attempted_install, (rate_limited or install_rate_limited)
 
 
+_INFLUX_CLIENT: Dict[Tuple, "InfluxDBClient"] = {}  # at most one entry: endpoint key -> client
+
+
+def get_influx_client(config: Dict, logger: logging.Logger) -> Optional["InfluxDBClient"]:
+    """Return a shared InfluxDB client for the configured URL, or None if it cannot be reached.
+
+    The client (and its connection pool) is reused until the resolved endpoint changes.
+    """
+    parsed_influx = parse_url(config["influx_url"])
+    resolved_ip, from_cache = resolve_influx_ip(parsed_influx.hostname or "", logger, influx_port(parsed_influx))
+    if resolved_ip and from_cache:
+        logger.debug("Using cached InfluxDB IP for %s", parsed_influx.hostname or "provided URL")
+    if parsed_influx.hostname and not resolved_ip:
+        logger.error("Unable to resolve InfluxDB host %s", parsed_influx.hostname)
+        return None
+    resolved_url, host_header, _ = build_influx_endpoint(config["influx_url"], resolved_ip)
+
+    key = (resolved_url, host_header, config["influx_token"], config["influx_org"], config["verify_tls"])
+    client = _INFLUX_CLIENT.get(key)
+    if client is not None:
+        return client
+    close_influx_client()
+    try:
+        client = create_influx_client(
+            url=resolved_url,
+            token=config["influx_token"],
+            org=config["influx_org"],
+            verify_tls=config["verify_tls"],
+            host_header=host_header,
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.error("Failed to create InfluxDB client: %s", exc)
+        return None
+    _INFLUX_CLIENT[key] = client
+    return client
+
+
+def close_influx_client() -> None:
+    for client in _INFLUX_CLIENT.values():
+        try:
+            client.close()
+        except Exception:  # noqa: BLE001
+            pass
+    _INFLUX_CLIENT.clear()
+
+
 def check_connectivity(config: Dict, logger: logging.Logger) -> bool:
     evo_ok = False
     influx_ok = False
@@ -626,22 +1031,9 @@ def check_connectivity(config: Dict, logger: logging.Logger) -> bool:
         else:
             logger.error("Evohome connectivity failed: %s", exc)
 
-    parsed_influx = urlparse(config["influx_url"])
-    resolved_ip, from_cache = resolve_influx_ip(parsed_influx.hostname or "", logger)
-    if resolved_ip and from_cache:
-        logger.info("Using cached InfluxDB IP for %s", parsed_influx.hostname or "provided URL")
-    if parsed_influx.hostname and not resolved_ip:
-        logger.error("Unable to resolve InfluxDB host %s", parsed_influx.hostname)
-    else:
-        resolved_url, host_header, _ = build_influx_endpoint(config["influx_url"], resolved_ip)
+    influx_client = get_influx_client(config, logger)
+    if influx_client is not None:
         try:
-            influx_client = create_influx_client(
-                url=resolved_url,
-                token=config["influx_token"],
-                org=config["influx_org"],
-                verify_tls=config["verify_tls"],
-                host_header=host_header,
-            )
             health = influx_client.health()
             status = getattr(health, "status", None) or (health.get("status") if isinstance(health, dict) else None)
             if status and str(status).lower() in {"pass", "ok", "healthy"}:
@@ -659,8 +1051,73 @@ def check_connectivity(config: Dict, logger: logging.Logger) -> bool:
     return evo_ok and influx_ok
 
 
+def collect_and_write(config: Dict, evo_client: "EvohomeClient", logger: logging.Logger) -> Tuple[bool, bool]:
+    """Run one collection cycle. Return (success, evohome_ok)."""
+    temperatures, installation, _attempted_install, rate_limited = fetch_evohome_data(
+        evo_client, config["location_idx"], logger
+    )
+    persist_token_cache(evo_client, logger)
+    evohome_ok = bool(temperatures) or rate_limited
+
+    if rate_limited:
+        logger.warning("Skipping write due to Evohome API rate limiting")
+        return False, evohome_ok
+
+    if not temperatures and not installation and not has_offline_records():
+        # Nothing new and no backlog: don't resolve or connect to InfluxDB at all.
+        logger.warning("No data; skipping write")
+        return True, evohome_ok
+
+    points = build_points(temperatures, installation, logger)
+
+    influx_client = get_influx_client(config, logger)
+    if not influx_client:
+        logger.error("InfluxDB client unavailable; caching %d records", len(points))
+        buffer_records(points, logger)
+        return False, evohome_ok
+
+    success = write_points(points, influx_client, config["influx_bucket"], config["influx_org"], logger)
+    return success, evohome_ok
+
+
+def run_daemon(config: Dict, interval: int, logger: logging.Logger) -> None:
+    stop = threading.Event()
+
+    def handle_signal(signum, _frame) -> None:
+        logger.info("Received signal %d; shutting down", signum)
+        stop.set()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    evo_client = None
+    logger.info("Running every %d seconds", interval)
+    try:
+        while not stop.is_set():
+            started = time.monotonic()
+            try:
+                if evo_client is None:
+                    try:
+                        evo_client = build_evo_client(config, logger)
+                    except Exception:  # noqa: BLE001
+                        evo_client = None  # build_evo_client already logged why
+                if evo_client is not None:
+                    success, evohome_ok = collect_and_write(config, evo_client, logger)
+                    if not evohome_ok:
+                        evo_client = None  # log in again next cycle
+                    if not success:
+                        logger.warning("Collection cycle failed; next attempt in %d seconds", interval)
+            except Exception:  # noqa: BLE001
+                # One bad cycle (corrupt buffer, odd resolver error, ...) must not end the service.
+                logger.exception("Collection cycle failed unexpectedly; next attempt in %d seconds", interval)
+            stop.wait(max(0.0, interval - (time.monotonic() - started)))
+    finally:
+        close_influx_client()
+
+
 def main() -> None:
     logger = setup_logger()
+    install_fast_json()
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     logger.debug("DATA_DIR resolved to %s", DATA_DIR)
 
@@ -671,49 +1128,16 @@ def main() -> None:
         success = check_connectivity(config, logger)
         sys.exit(0 if success else 1)
 
+    if args.interval:
+        run_daemon(config, args.interval, logger)
+        return
+
     try:
         evo_client = build_evo_client(config, logger)
     except Exception:
         sys.exit(1)
 
-    temperatures, installation, _attempted_install, rate_limited = fetch_evohome_data(
-        evo_client, config["location_idx"], logger
-    )
-    persist_token_cache(evo_client, logger)
-
-    parsed_influx = urlparse(config["influx_url"])
-    resolved_ip, from_cache = resolve_influx_ip(parsed_influx.hostname or "", logger)
-    if resolved_ip and from_cache:
-        logger.info("Using cached InfluxDB IP for %s", parsed_influx.hostname or "provided URL")
-    if parsed_influx.hostname and not resolved_ip:
-        logger.error("Unable to resolve InfluxDB host %s; will cache data locally", parsed_influx.hostname)
-    resolved_url, host_header, _ = build_influx_endpoint(config["influx_url"], resolved_ip)
-
-    influx_client: Optional[InfluxDBClient] = None
-    if resolved_url and resolved_ip:
-        try:
-            influx_client = create_influx_client(
-                url=resolved_url,
-                token=config["influx_token"],
-                org=config["influx_org"],
-                verify_tls=config["verify_tls"],
-                host_header=host_header,
-            )
-        except Exception as exc:  # noqa: BLE001
-            logger.error("Failed to create InfluxDB client: %s", exc)
-
-    points = build_points(temperatures, installation, logger)
-
-    if rate_limited:
-        logger.warning("Skipping write due to Evohome API rate limiting")
-        sys.exit(1)
-
-    if not influx_client:
-        logger.error("InfluxDB client unavailable; caching %d records", len(points))
-        persist_offline_records(load_offline_records() + points_to_lines(points), logger)
-        sys.exit(1)
-
-    success = write_points(points, influx_client, config["influx_bucket"], config["influx_org"], logger)
+    success, _evohome_ok = collect_and_write(config, evo_client, logger)
     if not success:
         sys.exit(1)
 